@@ -6,9 +6,28 @@
 #
 # THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+# bitboard helpers
+
+def bitboardToSquares(bitboard: int) -> list[int]:
+    """Lists the squares set in a bitboard
+
+    :bitboard: int - the bitboard (bit n set means square n is included)
+    :return: list[int] - the indexes of the set squares, lowest first
+
+    bitboardToSquares repeatedly pops the lowest set bit (bitboard & -bitboard) off the bitboard"""
+    squares = []
+    while bitboard:
+        lowestBit = bitboard & -bitboard
+        squares.append(lowestBit.bit_length() - 1)
+        bitboard ^= lowestBit
+    return squares
+
 # base piece class
 
 class piece:
+    __slots__ = ("position", "colour")
+    pieceType = 0  # the piece type id of each subclass (see pieces.py), as used by the board
+
     def __init__(self, boardIndex: int, colour: str) -> None:
         """Initialises a chess piece
 
@@ -20,17 +39,43 @@ class piece:
         self.position = boardIndex
         self.colour = colour
     
-    def getMoves(self, obstacles: list[bool], sideLength: int = 8) -> list[int]:
+    def getMoves(self, obstacles: int, sideLength: int = 8) -> int:
         """Returns the valid moves of a piece
 
         :self: piece - the piece type and its location
-        :obstacles: list[bool] - the potential blocking pieces
+        :obstacles: int - the potential blocking pieces, as a bitboard (bit n set means square n is occupied)
         :sideLength: - the side length of the board
-        :return: list[int] - the squares the given piece can move on to
+        :return: int - the squares the given piece can move on to, as a bitboard (use bitboardToSquares for a list)
 
-        piece.getMoves takes a list of obstacles, and using the self.position variable, determines all valid moves for the piece (using sideLength as a bounding check)
+        piece.getMoves takes a bitboard of obstacles, and using the self.position variable, determines all valid moves for the piece (using sideLength as a bounding check)
+        The obstacles are only read (as an int, they can't be changed), so callers can pass the board's occupancy without copying it
         """
-        return []
+        return 0
+
+    def getQuietMovesAndCaptures(self, ownPieces: int, enemyPieces: int, sideLength: int = 8) -> tuple[int, int]:
+        """Returns the valid moves of a piece, split into quiet moves and captures
+
+        :self: piece - the piece type and its location
+        :ownPieces: int - the bitboard of the pieces of this piece's colour
+        :enemyPieces: int - the bitboard of the other colour's pieces
+        :sideLength: - the side length of the board
+        :return: tuple[int, int] - the bitboards of the empty squares the piece can move to, and of the pieces it can capture
+
+        piece.getQuietMovesAndCaptures separates the first blocker of each move by colour, so callers don't have to classify the moves afterwards"""
+        obstacles = ownPieces | enemyPieces
+        moves = self.getMoves(obstacles, sideLength)
+        return moves & ~obstacles, moves & enemyPieces
+
+    def getMoveSquares(self, obstacles: int, sideLength: int = 8) -> list[int]:
+        """Returns the valid moves of a piece as a list of squares
+
+        :self: piece - the piece type and its location
+        :obstacles: int - the potential blocking pieces, as a bitboard (bit n set means square n is occupied)
+        :sideLength: - the side length of the board
+        :return: list[int] - the indexes of the squares the given piece can move on to, lowest first
+
+        piece.getMoveSquares is a thin wrapper for code that wants a list, the move generation itself stays on bitboards"""
+        return bitboardToSquares(self.getMoves(obstacles, sideLength))
     
     def move(self, newBoardIndex: int) -> None:
         """Emulates the movement of a piece
@@ -6,35 +6,67 @@
 #
 # THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from pieces import king, queen, rook, bishop, knight, pawn
+import random
+
+from base import bitboardToSquares
+from pieces import KING, QUEEN, ROOK, BISHOP, KNIGHT, PAWN, MOVE_GENERATORS, MOVE_GENERATORS_8, PAWN_ATTACKS
+
+# castling rights, the bits of board.castling
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+CASTLING_RIGHTS = {"K": WHITE_KINGSIDE, "Q": WHITE_QUEENSIDE, "k": BLACK_KINGSIDE, "q": BLACK_QUEENSIDE}  # by FEN letter
+# (kingside, queenside) rights for each colour
+COLOUR_CASTLING_RIGHTS = ((WHITE_KINGSIDE, WHITE_QUEENSIDE), (BLACK_KINGSIDE, BLACK_QUEENSIDE))
 
 # board class
 
 class board:
+    # every instance attribute (see __init__), so boards don't each carry a __dict__
+    __slots__ = ("castling", "sideLength", "moveGenerators", "sideToMove", "enPassantSquare", "fiftyMovesClock",
+                 "fullMoveClock", "pieceTypes", "pieceColours", "bitboards", "whiteOccupancy", "blackOccupancy",
+                 "occupancy", "zobristPieces", "zobristEnPassant", "zobrist", "moveCache", "attackCache")
+
     boardSideLength = 8  # default chess board
+    moveCacheSize = 1 << 16  # the most positions generateAllMoves remembers before starting over
 
     pieceMappings = {
-            "k": king,
-            "q": queen,
-            "r": rook,
-            "b": bishop,
-            "n": knight,
-            "p": pawn
+            "k": KING,
+            "q": QUEEN,
+            "r": ROOK,
+            "b": BISHOP,
+            "n": KNIGHT,
+            "p": PAWN
             }
+
     
-    def convertSquareToIndex(self, square: str) -> int:
+    def convertSquareToIndex(self, square: str | bytes) -> int:
         """Converts a square on the chess board to a list index
 
         :self: board - the board the square index is wanted from
-        :square: str - the corresponding board square string (like a1)
+        :square: str | bytes - the corresponding board square string (like a1)
 
         board.convertSquareToIndex takes a SAN square and converts it to an index on the board itself."""
         square = square.strip()
+        if isinstance(square, str):
+            try:
+                square = square.encode("ascii")  # work on the character codes
+            except UnicodeEncodeError:  # no square name is outside ASCII
+                raise Exception("Square is invalid")
         if not len(square) >= 2:
             raise Exception("Square is invalid")
-        # ord square[0] - 97 converts the letter into an index of the alphabet
-        return ((self.sideLength * (self.sideLength - int(square[1 : ]))) + 
-                (ord(square[0].casefold()) - 97))
+        # square[0] | 0x20 lowercases the file letter, and - 97 converts it into an index of the alphabet
+        file = (square[0] | 0x20) - 97
+        if self.sideLength == 8 and len(square) == 2:
+            # the rank is a single digit (- 48 converts it to a number), and shift instead of multiplying
+            index = ((56 - square[1]) << 3) + file
+        else:
+            try:
+                index = (self.sideLength * (self.sideLength - int(square[1 : ]))) + file
+            except ValueError:  # the rank isn't a number
+                raise Exception("Square is invalid")
+        # a square off the board (like a9) would otherwise index from the end of the per-square lists
+        if not (0 <= file < self.sideLength and 0 <= index < self.sideLength * self.sideLength):
+            raise Exception("Square is invalid")
+        return index
 
     def convertIndexToSquare(self, square: int):
         """Converts a list index into a square on the chess board
@@ -43,74 +75,133 @@ class board:
         :square: int - the index of the square on the board
 
         board.convertIndexToSquare takes an index on the board and converts it to a SAN square."""
+        if self.sideLength == 8:
+            return SQUARE_NAMES[square]  # the default board's squares are named in advance
         return chr((square % self.sideLength) + 97) + str(self.sideLength - (square // self.sideLength))
 
-    def __init__(self, startingFen: str) -> None:
+    def __init__(self, startingFen: str, validate: bool = True) -> None:
         """Initialises a chess board
 
         :self: board - the board the game will take place on
         :startingFen: str - the associated FEN code for the chess game
+        :validate: bool - if the FEN code is checked for mistakes (see board.fromFenUnchecked)
 
         This constructor takes a FEN code and parses it into a board object"""
         # variable declarations
-        self.boardPieces = []
-        self.castling = []
+        self.castling = 0  # a mask of the castling right bits (see WHITE_KINGSIDE and so on)
         self.sideLength = board.boardSideLength
-        self.playerTurn = None
+        # the 8x8 generators skip the side length checks entirely
+        self.moveGenerators = MOVE_GENERATORS_8 if self.sideLength == 8 else MOVE_GENERATORS
+        self.sideToMove = 0  # 0 for white, 1 for black (see the playerTurn property for the letter)
         self.enPassantSquare = None
         self.fiftyMovesClock = 0
         self.fullMoveClock = 1
 
-        # process the FEN code
-        startingFen = startingFen.strip()
-        startingFen = startingFen.replace("/", " ")
+        # what is on each square, 0 for an empty square or the piece type id (see pieces.py)
+        # and the piece's colour (0 for white, 1 for black)
+        self.pieceTypes = bytearray(self.sideLength * self.sideLength)
+        self.pieceColours = bytearray(self.sideLength * self.sideLength)
+
+        # bitboards (bit n set means square n is occupied), one for each piece type and colour
+        # a piece is stored in self.bitboards[(pieceType - 1) * 2 + colour]
+        self.bitboards = [0] * 12
+        self.whiteOccupancy = 0
+        self.blackOccupancy = 0
+        self.occupancy = 0
 
-        # split into the "components"
-        components = [component for component in startingFen.split(" ") if not component.isspace()]
-        # clean up the original startingFen variable
-        del startingFen
+        # zobrist hash of the position, kept up to date by _remove, _move and move
+        self.zobristPieces, self.zobristEnPassant = _getZobristKeys(self.sideLength * self.sideLength)
+        self.zobrist = 0
+        self.moveCache = {}  # (zobrist, colour) -> generateAllMoves result
+        self.attackCache = {}  # (zobrist, colour) -> _attackedSquares result
+
+        # process the FEN code, split into the "components" (ranks are separated like the other fields)
+        # split() skips leading, trailing and repeated whitespace, so no component is empty
+        components = startingFen.translate(_fenSeparators).split()
 
         # validate number of components
-        if len(components) != self.sideLength + 5:
+        if validate and len(components) != self.sideLength + 5:
             raise Exception("FEN is not long enough (potential missing info)")
 
-        for componentsIndex in range(self.sideLength):
-            chessLineSum = 0
-            for pieceLetter in components[componentsIndex]:
-                if pieceLetter.isdecimal():
-                    chessLineSum += int(pieceLetter)
-                    for _ in pieceLetter:
-                        self.boardPieces.append(None)
-                    continue  # ignore interpreting the letter as a piece
-                if pieceLetter.isupper():
-                    pieceColour = "w"
-                else:
-                    pieceColour = "b"
-
-                try:
-                    self.boardPieces.append((board.pieceMappings[pieceLetter.casefold()])(len(self.boardPieces), pieceColour))
-                except KeyError:
-                    raise Exception("Invalid Piece in FEN (may be caused by invalid side length)")
-                
-                chessLineSum += 1
-            if chessLineSum != self.sideLength:
-                raise Exception("Incorrect number of pieces")
+        self.bitboards = _parseFenPlacement(components, self.sideLength, validate)
+        pieceKeys = self.zobristPieces
+        for bitboardIndex, bitboard in enumerate(self.bitboards):
+            pieceType, pieceColour = (bitboardIndex >> 1) + 1, bitboardIndex & 1  # the reverse of (pieceType - 1) * 2 + colour
+            for squareIndex in bitboardToSquares(bitboard):
+                self.pieceTypes[squareIndex] = pieceType
+                self.pieceColours[squareIndex] = pieceColour
+                self.zobrist ^= pieceKeys[bitboardIndex][squareIndex]
+
+        # even bitboards are white pieces, odd bitboards are black pieces
+        for bitboardIndex in range(0, 12, 2):
+            self.whiteOccupancy |= self.bitboards[bitboardIndex]
+            self.blackOccupancy |= self.bitboards[bitboardIndex + 1]
+        self.occupancy = self.whiteOccupancy | self.blackOccupancy
         
         # sideLength coincides with the index of the colour (colour comes straight after pieces, and pieces end at self.sideLength)
-        if components[self.sideLength] not in ("w", "b"):
+        if validate and components[self.sideLength] not in ("w", "b"):
             raise Exception("Invalid colour turn")
-        self.playerTurn = components[self.sideLength]
+        if components[self.sideLength] == "b":
+            self.sideToMove = 1
+            self.zobrist ^= ZOBRIST_TURN
 
         for castlingRight in components[self.sideLength + 1]:
-            if castlingRight.casefold() in ("q", "k"):
-                self.castling.append(castlingRight)
+            self.castling |= CASTLING_RIGHTS.get(castlingRight, 0)  # anything else (like "-") adds no rights
+        self.zobrist ^= ZOBRIST_CASTLING[self.castling]
 
         if components[self.sideLength + 2] != "-":
             self.enPassantSquare = self.convertSquareToIndex(components[self.sideLength + 2])
+            self.zobrist ^= self.zobristEnPassant[self.enPassantSquare]
 
         self.fiftyMovesClock = int(components[self.sideLength + 3])
         self.fullMoveClock = int(components[self.sideLength + 4])
     
+    @classmethod
+    def fromFenUnchecked(cls, fen: str) -> "board":
+        """Creates a board from a FEN code that is known to be valid
+
+        :cls: type[board] - the board class
+        :fen: str - a valid FEN code for the chess game
+        :return: board - the board of the FEN code
+
+        board.fromFenUnchecked skips the component count, rank length and colour checks of the constructor,
+        for loading trusted positions (such as ones the board has generated itself). Unknown piece letters still raise."""
+        return cls(fen, False)
+
+    @property
+    def playerTurn(self) -> str:
+        """The colour to move, as a FEN letter ("w" or "b")"""
+        return "wb"[self.sideToMove]
+
+    @playerTurn.setter
+    def playerTurn(self, colour: str) -> None:
+        if colour not in ("w", "b"):
+            raise Exception("Invalid colour turn")
+        sideToMove = 0 if colour == "w" else 1
+        if sideToMove != self.sideToMove:
+            self.sideToMove = sideToMove
+            self.zobrist ^= ZOBRIST_TURN
+
+    @classmethod
+    def decodeFenBatch(cls, fens: list[str]) -> list[list[int]]:
+        """Decodes the piece placement of many FEN codes straight into bitboards
+
+        :cls: type[board] - the board class
+        :fens: list[str] - the FEN codes to decode
+        :return: list[list[int]] - the 12 bitboards of each FEN, indexed like board.bitboards
+
+        board.decodeFenBatch is for loading positions in bulk. It skips building a board for each FEN,
+        and only checks the piece placement, rank count and lengths included (the other fields are ignored)."""
+        decoded = []
+        for fen in fens:
+            # only the piece placement is needed, so the other fields are never split apart
+            placement = fen.split(None, 1)[ : 1] or [""]
+            ranks = placement[0].split("/")
+            if len(ranks) != cls.boardSideLength:  # _parseFenPlacement only reads the first sideLength ranks
+                raise Exception("Incorrect number of pieces")
+            decoded.append(_parseFenPlacement(ranks, cls.boardSideLength, True))
+        return decoded
+
     def checkMove(self, origin: int, target: int) -> bool:
         """Validates a move based on an origin point and a target square
         
@@ -119,7 +210,209 @@ class board:
         :target: int - the target index of the piece (the new location)
         :return: bool - if the piece can move to the target square (excluding exceptions, which are handled only in move with completeAdminTasks = True)
         """
-        return target in self.boardPieces[origin].getMoves([x != None for x in self.boardPieces])
+        pieceType = self.pieceTypes[origin]
+        if not pieceType:
+            return False  # there is no piece on the origin square
+        return bool((self.moveGenerators[pieceType](origin, self.pieceColours[origin], self.occupancy, self.sideLength) >> target) & 1)
+
+    def getQuietMovesAndCaptures(self, origin: int) -> tuple[int, int]:
+        """Splits the moves of a piece into quiet moves and captures
+
+        :self: board - a board of pieces
+        :origin: int - the index of the piece
+        :return: tuple[int, int] - the bitboards of the empty squares the piece can move to, and of the enemy pieces it can capture (both 0 if there is no piece)
+
+        Like checkMove, this does not consider checks, castling or en passant."""
+        pieceType = self.pieceTypes[origin]
+        if not pieceType:
+            return 0, 0  # there is no piece on the origin square
+        colour = self.pieceColours[origin]
+        enemyPieces = self.blackOccupancy if colour == 0 else self.whiteOccupancy
+        moves = self.moveGenerators[pieceType](origin, colour, self.occupancy, self.sideLength)
+        return moves & ~self.occupancy, moves & enemyPieces
+
+    def generateAllMoves(self, colour: int) -> list[tuple[int, int]]:
+        """Generates the moves of every piece of one colour
+
+        :self: board - a board of pieces
+        :colour: int - the colour to generate moves for (0 for white, 1 for black, like board.sideToMove)
+        :return: list[tuple[int, int]] - (origin, target) pairs for each move
+
+        board.generateAllMoves walks the colour's bitboards instead of the whole board, and removes own-colour
+        targets with a single mask per piece. Like checkMove, it does not consider checks, castling or en passant.
+        Results are cached by the position's zobrist hash, so a position that comes up again is not regenerated."""
+        cacheKey = (self.zobrist, colour)
+        cachedMoves = self.moveCache.get(cacheKey)
+        if cachedMoves is not None:
+            return list(cachedMoves)  # a copy, so the caller can't change the cached moves
+
+        ownPieces = self.whiteOccupancy if colour == 0 else self.blackOccupancy
+
+        # local names for everything the loops read, so each iteration skips the attribute lookups
+        occupancy, sideLength, bitboards = self.occupancy, self.sideLength, self.bitboards
+        notOwnPieces = ~ownPieces  # a piece can never capture its own colour
+
+        moves = []
+        for pieceType, moveGenerator in enumerate(self.moveGenerators[KING : PAWN + 1], KING):
+            for origin in bitboardToSquares(bitboards[(pieceType - 1) * 2 + colour]):
+                targets = moveGenerator(origin, colour, occupancy, sideLength) & notOwnPieces
+                # pop the targets' bits here rather than building a list with bitboardToSquares
+                while targets:
+                    lowestBit = targets & -targets
+                    moves.append((origin, lowestBit.bit_length() - 1))
+                    targets ^= lowestBit
+
+        if len(self.moveCache) >= self.moveCacheSize:
+            self.moveCache.clear()  # keep the memory bounded
+        self.moveCache[cacheKey] = moves
+        return list(moves)
+
+    def _remove(self, index: int) -> None:
+        # take a piece off the board (and out of its bitboards)
+        pieceType = self.pieceTypes[index]
+        if not pieceType:
+            return
+        colour = self.pieceColours[index]
+        self.bitboards[(pieceType - 1) * 2 + colour] ^= 1 << index
+        self.zobrist ^= self.zobristPieces[(pieceType - 1) * 2 + colour][index]
+        if colour == 0:
+            self.whiteOccupancy ^= 1 << index
+        else:
+            self.blackOccupancy ^= 1 << index
+        self.occupancy ^= 1 << index
+        self.pieceTypes[index] = 0
+
+    def _shift(self, origin: int, target: int) -> None:
+        # move a piece onto an empty square, by toggling the origin and target bits of the moving piece
+        pieceType = self.pieceTypes[origin]
+        colour = self.pieceColours[origin]
+        moveMask = (1 << origin) | (1 << target)
+        self.bitboards[(pieceType - 1) * 2 + colour] ^= moveMask
+        pieceKeys = self.zobristPieces[(pieceType - 1) * 2 + colour]
+        self.zobrist ^= pieceKeys[origin] ^ pieceKeys[target]
+        if colour == 0:
+            self.whiteOccupancy ^= moveMask
+        else:
+            self.blackOccupancy ^= moveMask
+        self.occupancy ^= moveMask  # the target is empty, so this sets it and clears the origin
+
+        self.pieceTypes[target] = pieceType
+        self.pieceColours[target] = colour
+        self.pieceTypes[origin] = 0
+
+    def _move(self, origin: int, target: int) -> None:
+        # if we are allowing a move to occur
+        self._remove(target)  # clear out any captured piece first
+        self._shift(origin, target)
+
+    def _checkCastlingRights(self, colour: int) -> None:
+        # we won't be adding already removed castling rights
+        # look at current castling rights
+        kingsideRight, queensideRight = COLOUR_CASTLING_RIGHTS[colour]
+        if not self.castling & (kingsideRight | queensideRight):
+            return  # no colour specific rights left to remove
+        
+        kingIndex = self.bitboards[(KING - 1) * 2 + colour].bit_length() - 1  # the king's bit (-1 if there is no king)
+        if kingIndex == -1:
+            # do not attempt to check if there is no king
+            return
+        
+        if self.sideLength == 8:
+            kingRank, kingFile = kingIndex >> 3, kingIndex & 7
+        else:
+            kingRank, kingFile = divmod(kingIndex, self.sideLength)
+
+        kingInCorrectRank = False
+        if ((colour == 0 and kingRank == self.sideLength - 1) or
+            (colour == 1 and kingRank == 0)):
+            kingInCorrectRank = True
+        
+        if not (kingFile == 4 and kingInCorrectRank):  # if king isn't in e file or in the correct rank
+            # can't castle if king has moved
+            lostRights = kingsideRight | queensideRight
+        else:
+            # masks of the king's rank, at least 2 files either side of the king
+            # (only built here, where the king is on the e file and the shifts can't go negative)
+            rankStart = kingIndex - kingFile
+            kingsideMask = ((1 << (rankStart + self.sideLength)) - 1) & ~((1 << (kingIndex + 2)) - 1)
+            queensideMask = ((1 << (kingIndex - 1)) - 1) & ~((1 << rankStart) - 1)
+            rookBitboard = self.bitboards[(ROOK - 1) * 2 + colour]
+
+            lostRights = 0
+            if not rookBitboard & kingsideMask:  # kingside rook needs to be there
+                lostRights |= kingsideRight
+            if not rookBitboard & queensideMask:
+                lostRights |= queensideRight
+
+        castling = self.castling & ~lostRights
+        self.zobrist ^= ZOBRIST_CASTLING[self.castling] ^ ZOBRIST_CASTLING[castling]
+        self.castling = castling
+
+    def _attackedSquares(self, colour: int) -> int:
+        # the bitboard of every square a colour's pieces attack, built once per position
+        cacheKey = (self.zobrist, colour)
+        attacked = self.attackCache.get(cacheKey)
+        if attacked is not None:
+            return attacked
+
+        # loop invariants as locals, so the loops don't repeat the attribute lookups and arithmetic
+        occupancy, sideLength, bitboards = self.occupancy, self.sideLength, self.bitboards
+
+        attacked = 0
+        for pieceType in (KING, QUEEN, ROOK, BISHOP, KNIGHT):
+            moveGenerator = self.moveGenerators[pieceType]
+            for origin in bitboardToSquares(bitboards[(pieceType - 1) * 2 + colour]):
+                attacked |= moveGenerator(origin, colour, occupancy, sideLength)
+
+        # pawns attack diagonally forwards, which isn't where they move to
+        pawns = bitboards[(PAWN - 1) * 2 + colour]
+        if sideLength == 8:
+            pawnAttacks = PAWN_ATTACKS[colour]
+            for origin in bitboardToSquares(pawns):
+                attacked |= pawnAttacks[origin]
+        else:
+            forward = sideLength if colour else -sideLength  # white moves up the board (to lower indexes)
+            squareCount, lastFile = sideLength * sideLength, sideLength - 1
+            for origin in bitboardToSquares(pawns):
+                ahead = origin + forward
+                if 0 <= ahead < squareCount:
+                    file = origin % sideLength
+                    if file > 0:
+                        attacked |= 1 << (ahead - 1)
+                    if file < lastFile:
+                        attacked |= 1 << (ahead + 1)
+
+        if len(self.attackCache) >= self.moveCacheSize:
+            self.attackCache.clear()  # keep the memory bounded
+        self.attackCache[cacheKey] = attacked
+        return attacked
+
+    def _checkForCheck(self, colour: int) -> bool:
+        kingIndex = self.bitboards[(KING - 1) * 2 + colour].bit_length() - 1  # the king's bit (-1 if there is no king)
+        if kingIndex == -1:
+            return False
+        enemyColour = colour ^ 1
+
+        # a piece attacks the king exactly when the same piece on the king's square would attack it,
+        # so look outwards from the king once per piece type, rather than generating every enemy piece's moves
+        for pieceType in (KNIGHT, KING):
+            if (self.moveGenerators[pieceType](kingIndex, colour, self.occupancy, self.sideLength) &
+                self.bitboards[(pieceType - 1) * 2 + enemyColour]):
+                return True
+        enemyQueens = self.bitboards[(QUEEN - 1) * 2 + enemyColour]
+        for pieceType in (ROOK, BISHOP):
+            if (self.moveGenerators[pieceType](kingIndex, colour, self.occupancy, self.sideLength) &
+                (self.bitboards[(pieceType - 1) * 2 + enemyColour] | enemyQueens)):
+                return True
+
+        # pawns only capture forwards, so use the squares a pawn of the king's colour would capture from the king
+        enemyPawns = self.bitboards[(PAWN - 1) * 2 + enemyColour]
+        if self.sideLength == 8:
+            return bool(PAWN_ATTACKS[colour][kingIndex] & enemyPawns)
+        for pawnIndex in bitboardToSquares(enemyPawns):
+            if self.checkMove(pawnIndex, kingIndex):
+                return True
+        return False
 
     def move(self, origin: int, target: int, completeAdminTasks: bool = True) -> bool:
         """Moves a piece based on an origin point and a target square
@@ -128,205 +421,179 @@ class board:
         :origin: int - the index of the piece
         :target: int - the target index of the piece (the new location)
         :completeAdminTasks: bool - if the move is to complete all admin (switch turns, and deal with exceptions)"""
-        def _move(origin: int, target: int) -> None:
-            # if we are allowing a move to occur
-            self.boardPieces[target] = self.boardPieces[origin]
-            self.boardPieces[origin] = None
-            self.boardPieces[target].move(target)
-
         if not completeAdminTasks:
-            _move(origin, target)
+            self._move(origin, target)
             return True
         
         # we need to deal with admin, like checking legal moves, and exceptions to standard rules
-        def _checkCastlingRights(colour) -> None:
-            # we won't be adding already removed castling rights
-            # look at current castling rights
-            rights = self.castling
-            if colour == "w":
-                colourRights = [right for right in rights if right.isupper()]
-            else:
-                colourRights = [right for right in rights if right.islower()]
-            del rights
-            
-            kingIndex = -1
-            for index, piece in self.boardPieces:
-                if piece != None:
-                    if isinstance(piece, king) and piece.colour == colour:
-                        kingIndex = index
-                        break  # there should only be one king
-            if kingIndex == -1:
-                # do not attempt to check if there is no king
-                return
-            
-            kingInCorrectRank = False
-            if ((colour == "w" and kingIndex // self.sideLength == self.sideLength - 1) or
-                (colour == "b" and kingIndex // self.sideLength == 0)):
-                kingInCorrectRank = True
-            
-            for right in colourRights:  # colour specific rights
-                if not (kingIndex % self.sideLength == 4 and kingInCorrectRank):  # if king isn't in e file or in the correct rank
-                    # can't castle if king has moved
-                    self.castling.remove(right)
-                    continue
-
-                currentIndex = kingIndex
-                rookDetected = False
-                if right.casefold() == "k":
-                    # kingside rook needs to be there
-                    while currentIndex % self.sideLength < self.sideLength - 1:
-                        currentIndex += 1
-                        if isinstance(self.boardPieces[currentIndex], rook) and self.boardPieces[currentIndex].colour == colour:
-                            if currentIndex - kingIndex >= 2:
-                                rookDetected = True
-                                break
-
-                    if not rookDetected:
-                        self.castling.remove(right)
-                    continue
-                
-                currentIndex = kingIndex
-                rookDetected = False
-                if right.casefold() == "q":
-                    while currentIndex % self.sideLength > 0:
-                        currentIndex -= 1
-                        if isinstance(self.boardPieces[currentIndex], rook) and self.boardPieces[currentIndex].colour == colour:
-                            if kingIndex - currentIndex >= 2:
-                                rookDetected = True
-                                break
-
-                    if not rookDetected:
-                        self.castling.remove(right)
-                    continue
-
-        def _checkForCheck(colour) -> bool:
-            kingIndex = -1
-            for index, piece in self.boardPieces:
-                if piece != None:
-                    if isinstance(piece, king) and piece.colour == colour:
-                        kingIndex = index
-                        break  # there should only be one king
-            if kingIndex == -1:
-                return False
-            # execute get moves on all black pieces, if any piece
-            # attacks the king, then the king is in check
-            for index, piece in enumerate(self.boardPieces):
-                if self.checkMove(index, kingIndex) and piece.colour != colour:
-                    return True
-            return False
-
-        if self.boardPieces[origin] == None:
+        pieceType = self.pieceTypes[origin]
+        if not pieceType:
             return False  # moving nothing
 
-        if self.boardPieces[origin].colour == self.boardPieces[target].colour:
+        ownPieces = self.whiteOccupancy if self.pieceColours[origin] == 0 else self.blackOccupancy
+        if (ownPieces >> target) & 1:
             return False  # capturing own colour
-        
-        originalBoard = self.boardPieces  # in case we need to revert due to check
 
         # check if the move is in the getMoves list
         if self.checkMove(origin, target):
-            _move(origin, target)
-        elif isinstance(self.boardPieces[origin], pawn):
+            self._move(origin, target)
+        elif pieceType == PAWN:
             # check move using en passant
             # this just allows a pawn to "move" into an en passant square
-            if target in self.boardPieces[origin].getMoves([index == self.enPassantSquare or piece != None
-                                               for index, piece in enumerate(self.boardPieces)]):
-                _move(origin, target)
+            enPassantObstacles = self.occupancy
+            if self.enPassantSquare is not None:
+                enPassantObstacles |= 1 << self.enPassantSquare
+            if (self.moveGenerators[PAWN](origin, self.pieceColours[origin], enPassantObstacles, self.sideLength) >> target) & 1:
+                self._move(origin, target)
 
                 # capture the en-passanted piece
-                if self.boardPieces[target].colour == "w":
-                    self.boardPieces[target + self.sideLength] = None
+                if self.pieceColours[target] == 0:
+                    self._remove(target + self.sideLength)
                 else:
-                    self.boardPieces[target - self.sideLength] = None
+                    self._remove(target - self.sideLength)
             else:
                 return False
-        elif isinstance(self.boardPieces[origin], king):
+        elif pieceType == KING:
             # castling exception
             # king moves 2 spaces towards rook and rook moves next to the king
 
-            # the king mustn't pass a square that is attacked
+            # the king mustn't start on, pass or land on a square that is attacked
             # the king (nor the rook that he is castling to) may have moved
 
-            _checkCastlingRights(self.boardPieces[origin].colour)
+            self._checkCastlingRights(self.pieceColours[origin])
 
-            if self.boardPieces[origin].colour == "w":
-                castleRightToCheck = str.upper  # the uppercase rights (whites)
-            else:
-                castleRightToCheck = str.lower  # the lowercase rights (blacks)
+            kingsideRight, queensideRight = COLOUR_CASTLING_RIGHTS[self.pieceColours[origin]]
+            rookBitboard = self.bitboards[(ROOK - 1) * 2 + self.pieceColours[origin]]
+            rankStart = origin - origin % self.sideLength
+            rankMask = ((1 << self.sideLength) - 1) << rankStart  # the king's rank
 
-            # check if the castle is legal (i.e in castling rights list)
-            if (target == origin + 2) and (self.boardPieces[origin].colour in ("w", "b")):  # kingside
-                if not castleRightToCheck("k") in self.castling:
+            # check if the castle is legal (i.e in the castling rights)
+            if target == origin + 2:  # kingside
+                if not self.castling & kingsideRight:
                     return False
                 # if castle is still in the castling rights
-                # check for blocking pieces between
+                # check for blocking pieces between, the first piece after the king must be its rook
                 
-                currentIndex = origin
-                rookIndex = -1
-                while currentIndex % self.sideLength < self.sideLength - 1:
-                    currentIndex += 1
-                    if ((self.boardPieces[currentIndex] is not None) and
-                        ((not isinstance(self.boardPieces[currentIndex], rook)) or currentIndex - origin < 3)):
-                        # there is a piece in the way
-                        return False
-                    elif isinstance(self.boardPieces[currentIndex], rook):
-                        rookIndex = currentIndex
-                        break  # the rook has been found
-                if rookIndex < 0:
+                piecesAfter = self.occupancy & rankMask & ~((1 << (origin + 1)) - 1)
+                rookIndex = (piecesAfter & -piecesAfter).bit_length() - 1  # the closest piece (-1 if there is none)
+                if rookIndex < 0 or not (rookBitboard >> rookIndex) & 1:
                     return False  # no rook found
+                if rookIndex - origin < 3:
+                    return False  # there is no room for the king and rook to pass each other
 
-                _move(origin, origin + 1)
-                if _checkForCheck(self.boardPieces[origin + 1].colour):
-                    # revert the state
-                    self.boardPieces = originalBoard
-                    return False
-                _move(origin + 1, target)
-                if _checkForCheck(self.boardPieces[target].colour):
-                    self.boardPieces = originalBoard
-                    return False
+                # one AND with the enemy's attacks checks the king's whole path
+                kingPath = (1 << origin) | (1 << (origin + 1)) | (1 << target)
+                if self._attackedSquares(self.pieceColours[origin] ^ 1) & kingPath:
+                    return False  # the king can't castle out of, through or into check
                 # the castle has been proven valid
-                _move(rookIndex, target - 1)
+                self._move(origin, target)
+                self._move(rookIndex, target - 1)
 
-            if (target == origin - 2) and (self.boardPieces[origin].colour in ("w", "b")):  # queenside castle
-                if not castleRightToCheck("q") in self.castling:
+            elif target == origin - 2:  # queenside castle
+                if not self.castling & queensideRight:
                     return False
                 # if castle is still in the castling rights
-                # check for blocking pieces between
+                # check for blocking pieces between, the first piece before the king must be its rook
                 
-                currentIndex = origin
-                rookIndex = -1
-                while currentIndex % self.sideLength > 0:
-                    currentIndex -= 1
-                    if ((self.boardPieces[currentIndex] is not None) and
-                        ((not isinstance(self.boardPieces[currentIndex], rook)) or origin - currentIndex < 3)):
-                        # there is a piece in the way
-                        return False
-                    elif isinstance(self.boardPieces[currentIndex], rook):
-                        rookIndex = currentIndex
-                        break  # the rook has been found
-                if rookIndex < 0:
+                piecesBefore = self.occupancy & rankMask & ((1 << origin) - 1)
+                rookIndex = piecesBefore.bit_length() - 1  # the closest piece (-1 if there is none)
+                if rookIndex < 0 or not (rookBitboard >> rookIndex) & 1:
                     return False  # no rook found
+                if origin - rookIndex < 3:
+                    return False  # there is no room for the king and rook to pass each other
 
-                _move(origin, origin - 1)
-                if _checkForCheck(self.boardPieces[origin - 1].colour):
-                    # revert the state
-                    self.boardPieces = originalBoard
-                    return False
-                _move(origin - 1, target)
-                if _checkForCheck(self.boardPieces[target].colour):
-                    self.boardPieces = originalBoard
-                    return False
+                # one AND with the enemy's attacks checks the king's whole path
+                kingPath = (1 << origin) | (1 << (origin - 1)) | (1 << target)
+                if self._attackedSquares(self.pieceColours[origin] ^ 1) & kingPath:
+                    return False  # the king can't castle out of, through or into check
                 # the castle has been proven valid
-                _move(rookIndex, target + 1)
+                self._move(origin, target)
+                self._move(rookIndex, target + 1)
                 
             else:
                 return False  # castle is invalid
         else:
             return False  # move is illegal
 
+        # the en passant square only lasts for one move, and a pawn's double push makes a new one
+        if self.enPassantSquare is not None:
+            self.zobrist ^= self.zobristEnPassant[self.enPassantSquare]
+            self.enPassantSquare = None
+        if pieceType == PAWN and abs(target - origin) == 2 * self.sideLength:
+            self.enPassantSquare = (origin + target) >> 1  # the square the pawn passed over
+            self.zobrist ^= self.zobristEnPassant[self.enPassantSquare]
+
         # at the end we need to switch moves (assuming move is legal)
-        if self.playerTurn == "w":
-            self.playerTurn = "b"
-        else:
-            self.playerTurn = "w"
+        self.sideToMove ^= 1
+        self.zobrist ^= ZOBRIST_TURN
         return True  # if we have reached the end of the function, we return True
+
+# FEN piece letters, indexed by the letter's ASCII code and holding the index of the piece's bitboard
+# (see board.bitboards)
+_fenBitboardTable = [None] * 256
+for _letter, _pieceType in board.pieceMappings.items():
+    _fenBitboardTable[ord(_letter)] = (_pieceType - 1) * 2 + 1  # lowercase is black
+    _fenBitboardTable[ord(_letter.upper())] = (_pieceType - 1) * 2  # uppercase is white
+_fenBitboardTable = tuple(_fenBitboardTable)  # fixed once built
+del _letter, _pieceType
+_fenSeparators = str.maketrans("/", " ")  # for str.translate, turning rank separators into spaces
+
+def _parseFenPlacement(ranks: list[str], sideLength: int, validate: bool) -> list[int]:
+    # the 12 bitboards (indexed like board.bitboards) of the first sideLength ranks of a FEN code
+    bitboards = [0] * 12
+    squareIndex = 0  # tracked directly, rather than derived from what has been placed so far
+    for rankIndex in range(sideLength):
+        rankEnd = squareIndex + sideLength
+        try:
+            rankBytes = ranks[rankIndex].encode("ascii")
+        except UnicodeEncodeError:  # no piece letter is outside ASCII
+            raise Exception("Invalid Piece in FEN (may be caused by invalid side length)")
+        except IndexError:
+            raise Exception("FEN is not long enough (potential missing info)")
+        emptyRun = 0  # the number of empty squares being read (which may have several digits on larger boards)
+        # iterating bytes gives the character codes directly, so each one is a table lookup
+        for pieceByte in rankBytes:
+            if 48 <= pieceByte <= 57:  # "0" to "9"
+                # another digit turns the run n into n * 10 + digit, so skip the difference
+                squareIndex += emptyRun * 9 + pieceByte - 48
+                emptyRun = emptyRun * 10 + pieceByte - 48
+                continue  # ignore interpreting the letter as a piece
+            emptyRun = 0
+            bitboardIndex = _fenBitboardTable[pieceByte]
+            if bitboardIndex is None:
+                raise Exception("Invalid Piece in FEN (may be caused by invalid side length)")
+
+            if validate and squareIndex >= rankEnd:
+                raise Exception("Incorrect number of pieces")
+            bitboards[bitboardIndex] |= 1 << squareIndex
+            squareIndex += 1
+        if validate and squareIndex != rankEnd:
+            raise Exception("Incorrect number of pieces")
+    return bitboards
+
+# the names of the default 8x8 board's squares, by index
+SQUARE_NAMES = tuple(chr((_square & 7) + 97) + str(8 - (_square >> 3)) for _square in range(64))
+
+# zobrist keys, a random number for each part of a position that is XORed into the hash while it is present
+# every generator is seeded, so a position hashes the same way every run
+_zobristRandom = random.Random(2025)
+ZOBRIST_TURN = _zobristRandom.getrandbits(64)  # black to move
+_castlingRightKeys = [_zobristRandom.getrandbits(64) for _ in range(4)]
+# indexed by board.castling, each mask's key is the XOR of the keys of its rights
+ZOBRIST_CASTLING = (0,)
+for _castlingRightKey in _castlingRightKeys:
+    ZOBRIST_CASTLING += tuple(key ^ _castlingRightKey for key in ZOBRIST_CASTLING)
+del _castlingRightKeys, _castlingRightKey
+_zobristKeys = {}  # square count -> (piece keys, en passant keys)
+
+def _getZobristKeys(squareCount: int) -> tuple[list[list[int]], list[int]]:
+    # piece keys are indexed like board.bitboards, then by square
+    if squareCount not in _zobristKeys:
+        # each board size draws from its own generator, so its keys don't depend on which sizes were made first
+        sizeRandom = random.Random(2025 + squareCount)
+        pieceKeys = [[sizeRandom.getrandbits(64) for _ in range(squareCount)] for _ in range(12)]
+        enPassantKeys = [sizeRandom.getrandbits(64) for _ in range(squareCount)]
+        _zobristKeys[squareCount] = (pieceKeys, enPassantKeys)
+    return _zobristKeys[squareCount]
+
+_getZobristKeys(64)  # the default board's keys are built up front
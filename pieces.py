@@ -8,231 +8,427 @@
 
 from base import piece
 
-# standard chess pieces definitions
-
-class king(piece):
-    def getMoves(self, obstacles: list[bool], sideLength: int = 8) -> list[int]:
-        super().getMoves(obstacles, sideLength)
+# precomputed attack tables for the default 8x8 board
+
+def _buildAttackTable(offsets: tuple[tuple[int, int], ...]) -> tuple[int, ...]:
+    # for every square, set the bit of each (rank, file) offset that stays on the board
+    attackTable = []
+    for square in range(64):
+        rank, file = divmod(square, 8)
+        attacks = 0
+        for rankOffset, fileOffset in offsets:
+            if 0 <= rank + rankOffset < 8 and 0 <= file + fileOffset < 8:
+                attacks |= 1 << ((rank + rankOffset) * 8 + file + fileOffset)
+        attackTable.append(attacks)
+    return tuple(attackTable)
+
+KING_ATTACKS = _buildAttackTable(((-1, -1), (-1, 0), (-1, 1), (0, 1),
+                                  (1, 1), (1, 0), (1, -1), (0, -1)))
+KNIGHT_ATTACKS = _buildAttackTable(((-2, -1), (-2, 1), (-1, 2), (1, 2),
+                                    (2, 1), (2, -1), (1, -2), (-1, -2)))
+
+def _buildPawnTables() -> tuple[tuple[tuple[int, ...], ...], ...]:
+    # white pawns move towards rank 8 (index 0), black pawns towards rank 1
+    pushes, doublePushes, attacks = [], [], []
+    for rankStep, startingRank in ((-1, 6), (1, 1)):
+        colourPushes, colourDoublePushes, colourAttacks = [], [], []
+        for square in range(64):
+            rank, file = divmod(square, 8)
+            push = doublePush = attack = 0
+            if 0 <= rank + rankStep < 8:
+                push = 1 << (square + rankStep * 8)
+                if file > 0:
+                    attack |= 1 << (square + rankStep * 8 - 1)
+                if file < 7:
+                    attack |= 1 << (square + rankStep * 8 + 1)
+            if rank == startingRank:
+                doublePush = 1 << (square + rankStep * 16)
+            colourPushes.append(push)
+            colourDoublePushes.append(doublePush)
+            colourAttacks.append(attack)
+        pushes.append(tuple(colourPushes))
+        doublePushes.append(tuple(colourDoublePushes))
+        attacks.append(tuple(colourAttacks))
+    return tuple(pushes), tuple(doublePushes), tuple(attacks)
+
+# indexed by [colour][square], with colour 0 for white and 1 for black
+PAWN_PUSHES, PAWN_DOUBLE_PUSHES, PAWN_ATTACKS = _buildPawnTables()
+
+# magic bitboards for the default 8x8 board
+# the attacks of a rook/bishop are looked up with ((occupancy & mask) * magic) >> shift,
+# the magic numbers were found offline by random search for this board's indexing (a8 = 0)
+
+ROOK_MAGICS = (
+    0x4080001040002080, 0x0100110020400084, 0x08801000800a2000, 0x0100090020041001,
+    0x1280080002810400, 0x4080010400020080, 0x8080008001000200, 0x0600002040841102,
+    0x0020802040008000, 0x0102002a00804100, 0x0280801000802000, 0x0b01002100081000,
+    0x0088800400080081, 0x4005001802140100, 0x0004000890020104, 0x0602000128840e42,
+    0x80b0208004804000, 0x0420004000300041, 0x8006410015002000, 0x0100420010082201,
+    0x0023010004110800, 0x6044004002004100, 0x0800808001000200, 0x0004060001004484,
+    0x2000400480008020, 0x01050a0200204480, 0x0470008380200070, 0x0004220900100100,
+    0x0080080100100500, 0x0800020080800400, 0x0408100400080201, 0x0000004200008421,
+    0x0000400088800028, 0x2000400080802000, 0x0000200101001040, 0x0008001000808008,
+    0x1040080080800402, 0x0202000402000810, 0x0900010804000210, 0x2000800040800100,
+    0x8280004020004001, 0x8010002001424000, 0x002000a100430010, 0x9801041000210008,
+    0x0902060290060020, 0x4004000402008080, 0x0108c81001040002, 0x7001040040820001,
+    0x0c01800060c00180, 0x4000400020008180, 0x0009004016200100, 0x05e120400a021200,
+    0x0048080080040080, 0x0007000204000900, 0x1600304a08410c00, 0x0080b06185040a00,
+    0x0508110180016543, 0x0202008021001042, 0x10020c4020010011, 0x100069600c500101,
+    0x4922002090050802, 0x0002000801100402, 0xe0a0100904a84204, 0x0022182641810402,
+)
+
+BISHOP_MAGICS = (
+    0x2820043000830210, 0x2010019800988001, 0x0004140410420000, 0x4444440084020008,
+    0x0004042004400308, 0x001201442200100c, 0xa022120220040030, 0x1023210808010800,
+    0x0001411002020040, 0x040020680080a088, 0x2040840104090000, 0x2000840400840000,
+    0x00100c0d04000008, 0x0002010432400800, 0x0c02208401209080, 0x0008208041086001,
+    0x14c0801002420400, 0x0410800802088c06, 0x0002021008204102, 0x0028080082004000,
+    0x0102001012100081, 0x4001014201008290, 0x6a0400008a091061, 0x2000800022080204,
+    0x0da0841022280200, 0x30305010041c0084, 0x020026000c040c04, 0x0004040280401080,
+    0x0001001105004000, 0x0004190010900081, 0x0008010804840980, 0x5000820225110080,
+    0x2090904800104200, 0x0008020880221802, 0x4102004110100108, 0x0400401008020208,
+    0x0020048400108120, 0x2044100682404801, 0x0008208100008802, 0x20a9020021008420,
+    0x0024112028809180, 0x8084091882084814, 0x0005010802018104, 0x0000801148002400,
+    0x0000811212000c00, 0x0040040802101020, 0x0021040102000844, 0x1010210200300082,
+    0x9000881410842500, 0x0000809818224042, 0x0040010080908200, 0x0008040042020103,
+    0x4000080821010000, 0x0440222410208020, 0x2120202181111000, 0x0088020820690000,
+    0x00c4820110020200, 0x0000090041042000, 0x4400000100809001, 0x0300000001048808,
+    0x209400a040050100, 0x0880006104118200, 0x00c4400802040063, 0x2020388101040010,
+)
+
+ROOK_DIRECTIONS = ((0, 1), (0, -1), (-1, 0), (1, 0))
+BISHOP_DIRECTIONS = ((-1, 1), (1, 1), (1, -1), (-1, -1))
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+def _rayAttacks(square: int, occupancy: int, directions: tuple[tuple[int, int], ...], stopBeforeEdge: bool = False) -> int:
+    # walk each (rank, file) direction until the edge or the first occupied square (which is included)
+    rank, file = divmod(square, 8)
+    attacks = 0
+    for rankStep, fileStep in directions:
+        currentRank, currentFile = rank + rankStep, file + fileStep
+        while 0 <= currentRank < 8 and 0 <= currentFile < 8:
+            if stopBeforeEdge and not (0 <= currentRank + rankStep < 8 and 0 <= currentFile + fileStep < 8):
+                break  # the edge square never blocks anything, so it isn't relevant occupancy
+            attacks |= 1 << (currentRank * 8 + currentFile)
+            if (occupancy >> (currentRank * 8 + currentFile)) & 1:
+                break
+            currentRank += rankStep
+            currentFile += fileStep
+    return attacks
+
+def _buildMagicTables(directions: tuple[tuple[int, int], ...], magics: tuple[int, ...]) -> tuple[tuple[int, ...], tuple[int, ...], tuple[list[int], ...]]:
+    masks, shifts, attackTables = [], [], []
+    for square in range(64):
+        mask = _rayAttacks(square, 0, directions, True)
+        shift = 64 - mask.bit_count()
+        attackTable = [0] * (1 << (64 - shift))
+
+        # enumerate every subset of the mask (carry-rippler trick)
+        occupancy = 0
+        while True:
+            attackTable[((occupancy * magics[square]) & 0xFFFFFFFFFFFFFFFF) >> shift] = _rayAttacks(square, occupancy, directions)
+            occupancy = (occupancy - mask) & mask
+            if not occupancy:
+                break
+
+        masks.append(mask)
+        shifts.append(shift)
+        attackTables.append(attackTable)
+    return tuple(masks), tuple(shifts), tuple(attackTables)
+
+ROOK_MASKS, ROOK_SHIFTS, ROOK_ATTACKS = _buildMagicTables(ROOK_DIRECTIONS, ROOK_MAGICS)
+BISHOP_MASKS, BISHOP_SHIFTS, BISHOP_ATTACKS = _buildMagicTables(BISHOP_DIRECTIONS, BISHOP_MAGICS)
+
+def rookAttacks(square: int, occupancy: int) -> int:
+    """Looks up the squares a rook attacks on the default 8x8 board
+
+    :square: int - the index of the rook
+    :occupancy: int - the bitboard of every piece on the board
+    :return: int - the bitboard of attacked squares (including the first blocking piece in each direction)"""
+    return ROOK_ATTACKS[square][(((occupancy & ROOK_MASKS[square]) * ROOK_MAGICS[square]) & 0xFFFFFFFFFFFFFFFF) >> ROOK_SHIFTS[square]]
+
+def bishopAttacks(square: int, occupancy: int) -> int:
+    """Looks up the squares a bishop attacks on the default 8x8 board
+
+    :square: int - the index of the bishop
+    :occupancy: int - the bitboard of every piece on the board
+    :return: int - the bitboard of attacked squares (including the first blocking piece in each direction)"""
+    return BISHOP_ATTACKS[square][(((occupancy & BISHOP_MASKS[square]) * BISHOP_MAGICS[square]) & 0xFFFFFFFFFFFFFFFF) >> BISHOP_SHIFTS[square]]
+
+def queenAttacks(square: int, occupancy: int) -> int:
+    """Looks up the squares a queen attacks on the default 8x8 board
+
+    :square: int - the index of the queen
+    :occupancy: int - the bitboard of every piece on the board
+    :return: int - the bitboard of attacked squares (including the first blocking piece in each direction)"""
+    return rookAttacks(square, occupancy) | bishopAttacks(square, occupancy)
+
+# sliding move generator (a plain function of the position, so queens don't need rook and bishop objects)
+
+def _buildEdgeMasks(sideLength: int) -> tuple[int, int, int, int, int]:
+    # every square but the (first file, last file, first two files, last two files), then every square, for a board size
+    firstFile = 0
+    for rank in range(sideLength):
+        firstFile |= 1 << (rank * sideLength)
+    lastFile = firstFile << (sideLength - 1)
+    boardMask = (1 << (sideLength * sideLength)) - 1
+    return (boardMask & ~firstFile, boardMask & ~lastFile,
+            boardMask & ~(firstFile | firstFile << 1), boardMask & ~(lastFile | lastFile >> 1), boardMask)
+
+EDGE_MASKS = {}  # side length -> _buildEdgeMasks(side length), filled in as board sizes are used
+
+def _buildRayMasks(sideLength: int) -> dict[tuple[int, int], tuple[tuple[int, ...], bool]]:
+    # for each (rank, file) direction, the bitboard of every square along the ray from each square (to the edge),
+    # and if the ray goes towards higher indexes
+    notFirstFile, notLastFile, _, _, boardMask = _buildEdgeMasks(sideLength)
+    rayMasks = {}
+    for rankStep, fileStep in QUEEN_DIRECTIONS:
+        # a step that wraps around the side of the board lands on the opposite edge file,
+        # and a step off the top or bottom shifts the bit out of the board, so one mask ends the ray
+        if fileStep > 0:
+            edgeMask = notFirstFile
+        elif fileStep < 0:
+            edgeMask = notLastFile
+        else:
+            edgeMask = boardMask
+        step = rankStep * sideLength + fileStep
+
+        rays = []
+        for position in range(sideLength * sideLength):
+            ray = 0
+            square = 1 << position
+            while True:
+                square = (square << step if step > 0 else square >> -step) & edgeMask
+                if not square:
+                    break  # stepped off the board
+                ray |= square
+            rays.append(ray)
+        rayMasks[(rankStep, fileStep)] = (tuple(rays), step > 0)
+    return rayMasks
+
+RAY_MASKS = {}  # side length -> _buildRayMasks(side length), filled in as board sizes are used
+
+def _rayMoves(position: int, directions: tuple[tuple[int, int], ...], obstacles: int, sideLength: int) -> int:
+    if sideLength not in RAY_MASKS:
+        RAY_MASKS[sideLength] = _buildRayMasks(sideLength)
+    rayMasks = RAY_MASKS[sideLength]
+
+    legalMoves = 0
+    for direction in directions:
+        rays, towardsHigherIndexes = rayMasks[direction]
+        ray = rays[position]
+        blockers = ray & obstacles
+        if blockers:
+            # the first blocker is the closest set bit (the lowest when the ray goes up the indexes, otherwise the highest),
+            # it may be captured, but everything behind it along the same ray is cut off
+            if towardsHigherIndexes:
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+            ray ^= rays[blocker]
+        legalMoves |= ray
+
+    return legalMoves
+
+# piece type ids (0 is an empty square)
+
+KING, QUEEN, ROOK, BISHOP, KNIGHT, PAWN = range(1, 7)
+
+# move generators, shared by the piece classes and the board
+# colour is 0 for white and 1 for black, obstacles is a bitboard of every piece on the board,
+# and the result is a bitboard of the squares the piece can move to
+
+def kingMoves(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    """Returns the bitboard of squares a king on position can move to (without considering checks)"""
+    if sideLength == 8:
+        return KING_ATTACKS[position]
+
+    legalMoves = 0
+    # king can move one square in any of the 8 ordinal directions
+    # which basic directions the king can move in
+    file = position % sideLength
+    up = position >= sideLength
+    down = position < sideLength * sideLength - sideLength
+    left = file > 0
+    right = file < sideLength - 1
+
+    # THIS DOES NOT CONSIDER POTENTIAL ISSUES DUE TO CHECKS
+
+    if up and left:
+        legalMoves |= 1 << (position - sideLength - 1)
+    
+    if up:
+        legalMoves |= 1 << (position - sideLength)
+
+    if up and right:
+        legalMoves |= 1 << (position - sideLength + 1)
+
+    if right:
+        legalMoves |= 1 << (position + 1)
+
+    if down and right:
+        legalMoves |= 1 << (position + sideLength + 1)
+
+    if down:
+        legalMoves |= 1 << (position + sideLength)
+
+    if down and left:
+        legalMoves |= 1 << (position + sideLength - 1)
+
+    if left:
+        legalMoves |= 1 << (position - 1)
+
+    return legalMoves
+
+def queenMoves(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    """Returns the bitboard of squares a queen on position can move to"""
+    # queen can move any number of squares in the 8 ordinal directions (equivalent to a rook and a bishop)
+    if sideLength == 8:
+        return queenAttacks(position, obstacles)
+    return _rayMoves(position, QUEEN_DIRECTIONS, obstacles, sideLength)
+
+def rookMoves(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    """Returns the bitboard of squares a rook on position can move to"""
+    # rook can move any number of squares in a straight line
+    if sideLength == 8:
+        return rookAttacks(position, obstacles)
+    return _rayMoves(position, ROOK_DIRECTIONS, obstacles, sideLength)
+
+def bishopMoves(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    """Returns the bitboard of squares a bishop on position can move to"""
+    # bishop can move any number of squares diagonally
+    if sideLength == 8:
+        return bishopAttacks(position, obstacles)
+    return _rayMoves(position, BISHOP_DIRECTIONS, obstacles, sideLength)
+
+def knightMoves(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    """Returns the bitboard of squares a knight on position can move to"""
+    if sideLength == 8:
+        return KNIGHT_ATTACKS[position]
+
+    if sideLength not in EDGE_MASKS:
+        EDGE_MASKS[sideLength] = _buildEdgeMasks(sideLength)
+    notFirstFile, notLastFile, notFirstTwoFiles, notLastTwoFiles, _ = EDGE_MASKS[sideLength]
+
+    # knight moves 2 squares in a straight line (strictly), then moves one in the other axis
+    # each jump is a shift, a jump that wraps around the side of the board lands on the opposite edge files
+    # (so masking those files out removes it), and a jump off the top or bottom is shifted out of the board
+    knight = 1 << position
+    return (((knight << (2 * sideLength + 1)) & notFirstFile) |  # 2 down, 1 right
+            ((knight << (2 * sideLength - 1)) & notLastFile) |  # 2 down, 1 left
+            ((knight << (sideLength + 2)) & notFirstTwoFiles) |  # 1 down, 2 right
+            ((knight << (sideLength - 2)) & notLastTwoFiles) |  # 1 down, 2 left
+            ((knight >> (2 * sideLength + 1)) & notLastFile) |  # 2 up, 1 left
+            ((knight >> (2 * sideLength - 1)) & notFirstFile) |  # 2 up, 1 right
+            ((knight >> (sideLength + 2)) & notLastTwoFiles) |  # 1 up, 2 left
+            ((knight >> (sideLength - 2)) & notFirstTwoFiles))  # 1 up, 2 right
 
-        legalMoves = []
-        # king can move one square in any of the 8 ordinal directions
-        flags = {"up": self.position - sideLength >= 0,
-                 "down": self.position + sideLength < sideLength * sideLength,
-                 "left": self.position % sideLength >= 1,
-                 "right": self.position % sideLength <= 6}  # which basic directions the king can move in
+def pawnMoves(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    """Returns the bitboard of squares a pawn on position can move to (en passant is handled by the board)"""
+    # pawns can move 1 square forward (2 if it hasn't moved yet (ie on second or sixth rank)),
+    # can capture 1 square diagonally (only forwards, never backwards),
+    # and en passant (not accounted for here, will be up to the implementation of board class)
+    # colour is important here
 
-        # THIS DOES NOT CONSIDER POTENTIAL ISSUES DUE TO CHECKS
+    if sideLength == 8:
+        return _pawnMoves8(position, colour, obstacles)
+
+    legalMoves = 0
+
+    # the square in front of the pawn, white moves up the board (to lower indexes) and black moves down it
+    ahead = position - sideLength if colour == 0 else position + sideLength
+    if not 0 <= ahead < sideLength * sideLength:
+        return legalMoves  # the pawn is on the last rank, so there is nothing in front of it to check
+
+    rank, file = divmod(position, sideLength)
+
+    if not (obstacles >> ahead) & 1:  # if the next row doesn't contain a piece
+        legalMoves |= 1 << ahead
+
+        # a pawn that hasn't moved (on its second rank) can push twice, if both squares are empty
+        twoAhead = ahead + ahead - position
+        if (rank == (sideLength - 2 if colour == 0 else 1) and 0 <= twoAhead < sideLength * sideLength and
+            not (obstacles >> twoAhead) & 1):
+            legalMoves |= 1 << twoAhead
 
-        if flags["up"] and flags["left"]:
-            legalMoves.append(self.position - sideLength - 1)
-        
-        if flags["up"]:
-            legalMoves.append(self.position - sideLength)
+    if file > 0 and (obstacles >> (ahead - 1)) & 1:  # if there is a piece diagonally to the left, and we aren't going out of bounds
+        legalMoves |= 1 << (ahead - 1)
 
-        if flags["up"] and flags["right"]:
-            legalMoves.append(self.position - sideLength + 1)
+    if file < sideLength - 1 and (obstacles >> (ahead + 1)) & 1:  # if there is a piece diagonally to the right, and we aren't going out of bounds
+        legalMoves |= 1 << (ahead + 1)
 
-        if flags["right"]:
-            legalMoves.append(self.position + 1)
+    return legalMoves
 
-        if flags["down"] and flags["right"]:
-            legalMoves.append(self.position + sideLength + 1)
+# indexed by piece type id
+MOVE_GENERATORS = (None, kingMoves, queenMoves, rookMoves, bishopMoves, knightMoves, pawnMoves)
 
-        if flags["down"]:
-            legalMoves.append(self.position + sideLength)
+# move generators specialised for the default 8x8 board (no side length checks, straight to the tables)
 
-        if flags["down"] and flags["left"]:
-            legalMoves.append(self.position + sideLength - 1)
+def _kingMoves8(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    return KING_ATTACKS[position]
 
-        if flags["left"]:
-            legalMoves.append(self.position - 1)
+def _knightMoves8(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    return KNIGHT_ATTACKS[position]
+
+def _queenMoves8(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    return queenAttacks(position, obstacles)
+
+def _rookMoves8(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    return rookAttacks(position, obstacles)
+
+def _bishopMoves8(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    return bishopAttacks(position, obstacles)
+
+def _pawnMoves8(position: int, colour: int, obstacles: int, sideLength: int = 8) -> int:
+    # a pawn can push onto an empty square (and push twice from its starting rank if both squares are empty),
+    # and capture onto an occupied diagonal square
+    pushes = PAWN_PUSHES[colour][position] & ~obstacles
+    if pushes:
+        pushes |= PAWN_DOUBLE_PUSHES[colour][position] & ~obstacles
+    return pushes | (PAWN_ATTACKS[colour][position] & obstacles)
 
-        return legalMoves
+MOVE_GENERATORS_8 = (None, _kingMoves8, _queenMoves8, _rookMoves8, _bishopMoves8, _knightMoves8, _pawnMoves8)
 
-class queen(piece):
-    def getMoves(self, obstacles: list[bool], sideLength: int = 8) -> list[int]:
-        super().getMoves(obstacles, sideLength)
-
-        # queen can move any number of squares in the 8 ordinal directions (equivalent to a rook and a bishop)
-        rookEquivalent = rook(self.position, self.colour)
-        bishopEquivalent = bishop(self.position, self.colour)
-        
-        # get the rook and bishop moves and combine them to form the queen's moves
-        return (rookEquivalent.getMoves(obstacles, sideLength)
-                + bishopEquivalent.getMoves(obstacles, sideLength))
-
-class rook(piece):
-    def getMoves(self, obstacles: list[bool], sideLength: int = 8) -> list[int]:
-        super().getMoves(obstacles, sideLength)
-
-        # rook can move any number of squares in a straight line
-
-        currentIndex = self.position
-        obstacles[currentIndex] = False
-
-        legalMoves = []
+# standard chess pieces definitions
 
-        # moving right
-        while not (obstacles[currentIndex] or (currentIndex % sideLength >= sideLength - 1)):
-            currentIndex += 1
-            legalMoves.append(currentIndex)
+class king(piece):
+    __slots__ = ()  # no attributes beyond the base piece
+    pieceType = KING
 
-        # reset between iterations
-        
-        currentIndex = self.position
+    def getMoves(self, obstacles: int, sideLength: int = 8) -> int:
+        return kingMoves(self.position, self.colour == "b", obstacles, sideLength)
 
-        # move left
-        while not (obstacles[currentIndex] or (currentIndex % sideLength <= 0)):
-            currentIndex -= 1
-            legalMoves.append(currentIndex)
+class queen(piece):
+    __slots__ = ()  # no attributes beyond the base piece
+    pieceType = QUEEN
 
-        # move up
-        currentIndex = self.position
-        while not (obstacles[currentIndex] or (currentIndex - sideLength <= 0)):
-            currentIndex -= sideLength
-            legalMoves.append(currentIndex)
+    def getMoves(self, obstacles: int, sideLength: int = 8) -> int:
+        return queenMoves(self.position, self.colour == "b", obstacles, sideLength)
 
-        # move down
-        currentIndex = self.position
-        while not (obstacles[currentIndex] or (currentIndex + sideLength >= sideLength * sideLength)):
-            currentIndex += sideLength
-            legalMoves.append(currentIndex)
+class rook(piece):
+    __slots__ = ()  # no attributes beyond the base piece
+    pieceType = ROOK
 
-        return legalMoves
+    def getMoves(self, obstacles: int, sideLength: int = 8) -> int:
+        return rookMoves(self.position, self.colour == "b", obstacles, sideLength)
 
 class bishop(piece):
-    def getMoves(self, obstacles: list[bool], sideLength: int = 8) -> list[int]:
-        super().getMoves(obstacles, sideLength)
-
-        # bishop can move any number of squares diagonally
-
-        currentIndex = self.position
-        obstacles[currentIndex] = False
-
-        legalMoves = []
-
-        # moving north east
-        while not (currentIndex % sideLength >= sideLength - 1 or
-                   currentIndex - sideLength < 0 or
-                   obstacles[currentIndex]):
-            currentIndex = currentIndex - sideLength + 1  # move one rank up and one file east
-            legalMoves.append(currentIndex)
-        
-        # reset index to prevent duplicate items
-        currentIndex = self.position
-
-        # moving south east
-        while not (currentIndex % sideLength >= sideLength - 1 or
-                   currentIndex + sideLength >= sideLength * sideLength or
-                   obstacles[currentIndex]):
-            currentIndex = currentIndex + sideLength + 1  # move one rank down and one file east
-            legalMoves.append(currentIndex)
+    __slots__ = ()  # no attributes beyond the base piece
+    pieceType = BISHOP
 
-        currentIndex = self.position
-
-        # moving south west
-        while not (currentIndex % sideLength <= 0 or
-                   currentIndex + sideLength >= sideLength * sideLength or
-                   obstacles[currentIndex]):
-            currentIndex = currentIndex + sideLength - 1  # move one rank down and one file east
-            legalMoves.append(currentIndex)
-
-        currentIndex = self.position
-
-        # moving north west
-        while not (currentIndex % sideLength <= 0 or
-                   currentIndex - sideLength < 0 or
-                   obstacles[currentIndex]):
-            currentIndex = currentIndex - sideLength - 1  # move one rank up and one file west
-            legalMoves.append(currentIndex)
-
-        return legalMoves
+    def getMoves(self, obstacles: int, sideLength: int = 8) -> int:
+        return bishopMoves(self.position, self.colour == "b", obstacles, sideLength)
 
 class knight(piece):
-    def getMoves(self, obstacles: list[bool], sideLength: int = 8) -> list[int]:
-        super().getMoves(obstacles, sideLength)
-
-        legalMoves = []
-
-        # knight moves 2 squares in a straight line (strictly), then moves one in the other axis
-        # if the position is not further than the final index after moving down twice
-        
-        # knight moves 2 squares down
-        if self.position + (2 * sideLength) < sideLength * sideLength:
-            # if the left and right side don't exceed the edge (to NOT provide incorrect indexes)...
-            if self.position % sideLength != 0:
-                legalMoves.append(self.position + (2 * sideLength) - 1)
-
-            if self.position % sideLength != 7:
-                legalMoves.append(self.position + (2 * sideLength) + 1)
-
-        # knight moves 2 squares up
-        if self.position - (2 * sideLength) >= 0:
-            # same code as the left and right side checks
-            if self.position % sideLength != 0:
-                legalMoves.append(self.position - (2 * sideLength) - 1)
-
-            if self.position % sideLength != 7:
-                legalMoves.append(self.position - (2 * sideLength) + 1)
-
-        # knight moves 2 squares left
-        if not self.position % sideLength <= 1:
-            if self.position - sideLength >= 0:
-                legalMoves.append(self.position - 2 - sideLength)
-                
-            if self.position + sideLength < sideLength * sideLength:
-                legalMoves.append(self.position - 2 + sideLength)
-
-        # knight moves 2 squares right
-        if not self.position % sideLength >= 6: 
-            if self.position - sideLength >= 0:
-                legalMoves.append(self.position + 2 - sideLength)
-
-            if self.position + sideLength < sideLength * sideLength:
-                legalMoves.append(self.position + 2 + sideLength)
-
-        return legalMoves
+    __slots__ = ()  # no attributes beyond the base piece
+    pieceType = KNIGHT
+
+    def getMoves(self, obstacles: int, sideLength: int = 8) -> int:
+        return knightMoves(self.position, self.colour == "b", obstacles, sideLength)
 
 class pawn(piece):
-    def getMoves(self, obstacles: list[bool], sideLength: int = 8) -> list[int]:
-        super().getMoves(obstacles, sideLength)
-
-        # pawns can move 1 square forward (2 if it hasn't moved yet (ie on second or sixth rank)),
-        # can capture 1 square diagonally (only forwards, never backwards),
-        # and en passant (not accounted for here, will be up to the implementation of board class)
-        # colour is important here
-
-        legalMoves = []
-
-        if self.colour == "w":
-            if not (self.position - sideLength < 0 or 
-                    obstacles[self.position - sideLength]):  # if the next row doesn't contain a piece NOR is it out of bounds
-                legalMoves.append(self.position - sideLength)
-
-            if obstacles[self.position - sideLength] and (
-                    not (self.position - sideLength < 0 or
-                         self.position % sideLength <= 0)):  # if there is a piece to the top left, and we aren't going out of bounds
-                    legalMoves.append(self.position - sideLength - 1)
-            
-            if obstacles[self.position - sideLength] and (
-                    not (self.position - sideLength < 0 or
-                         self.position % sideLength >= sideLength - 1)):  # if there is a piece to the top right, and we aren't going out of bounds
-                    legalMoves.append(self.position - sideLength + 1)
-
-            return legalMoves
-
-        # if colour == "b"
-        if not (self.position + sideLength >= sideLength * sideLength or 
-                obstacles[self.position + sideLength]):  # if the next row doesn't contain a piece NOR is it out of bounds
-            legalMoves.append(self.position + sideLength)
-
-        if obstacles[self.position + sideLength] and (
-                not (self.position + sideLength >= sideLength * sideLength or
-                     self.position % sideLength <= 0)):  # if there is a piece to the top left, and we aren't going out of bounds
-                legalMoves.append(self.position + sideLength - 1)
-            
-        if obstacles[self.position + sideLength] and (
-                not (self.position + sideLength >= sideLength * sideLength or
-                     self.position % sideLength >= sideLength - 1)):  # if there is a piece to the top right, and we aren't going out of bounds
-                legalMoves.append(self.position + sideLength + 1)
-        return legalMoves
+    __slots__ = ()  # no attributes beyond the base piece
+    pieceType = PAWN
+
+    def getMoves(self, obstacles: int, sideLength: int = 8) -> int:
+        return pawnMoves(self.position, self.colour == "b", obstacles, sideLength)
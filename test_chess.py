@@ -0,0 +1,42 @@
+# Copyright 2025 Neil Li
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import unittest
+
+from chess import board
+
+# regression checks, run with python -m unittest
+
+class castlingTests(unittest.TestCase):
+    def testKingOnA8WithCastlingRights(self):
+        # the castling rook masks used to be built before the e file test, shifting by -1 for a king on a8
+        chessBoard = board("K7/8/8/8/8/8/8/4k3 w Q - 0 1")
+        self.assertFalse(chessBoard.move(0, 2))
+        self.assertEqual(chessBoard.castling, 0)
+
+class fenTests(unittest.TestCase):
+    def testDecodeFenBatchMatchesBoard(self):
+        fen = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+        self.assertEqual(board.decodeFenBatch([fen]), [board(fen).bitboards])
+
+    def testDecodeFenBatchRejectsWrongRankCount(self):
+        for fen in ("8/8/8/8/8/8/8/8/8 w - - 0 1", "8/8/8/8/8/8/8/8/junk w - - 0 1", "8/8/8/8/8/8/8 w - - 0 1"):
+            with self.assertRaises(Exception):
+                board.decodeFenBatch([fen])
+
+class squareTests(unittest.TestCase):
+    def testInvalidSquaresAreRejected(self):
+        chessBoard = board("8/8/8/8/8/8/8/8 w - - 0 1")
+        for square in ("a9", "i1", "é4", "ax"):
+            with self.assertRaises(Exception):
+                chessBoard.convertSquareToIndex(square)
+        with self.assertRaises(Exception):
+            board("8/8/8/8/8/8/8/8 w - a9 0 1")  # an en passant square off the board
+
+if __name__ == "__main__":
+    unittest.main()